@@ -9,6 +9,17 @@ TIMEOUT = 40  # Saniye cinsinden istek zaman aşımı
 RETRY_COUNT = 1  # Yeniden deneme sayısı
 CHUNK_SIZE = 5000  # İşlenecek domain grubu büyüklüğü
 
+# Bağlantı havuzu ayarları
+CONNECTION_LIMIT_PER_HOST = 0  # Host başına eşzamanlı bağlantı sınırı (0: sınırsız)
+KEEPALIVE_TIMEOUT = 15  # Boştaki bağlantıların yeniden kullanım için açık tutulma süresi (saniye, aiohttp varsayılanı)
+FORCE_CLOSE = False  # True ise her istekten sonra bağlantı kapatılır (keep-alive devre dışı)
+DNS_CACHE_TTL = 300  # DNS önbelleği süresi (saniye)
+
+# Önceliklendirme ayarları
+DEADLINE_SECONDS = 0  # Taramanın tamamlanması gereken süre (saniye, 0: süre sınırı yok)
+PRIORITY_FILE = None  # Öncelik sırası dosyası (her satırda bir domain, en önemli ilk satırda)
+DEFAULT_PRIORITY = 1.0  # Puanı belirtilmemiş domainlerin öncelik puanı
+
 # Hedef dosya yolları
 JS_PATHS = [
     "/wp-includes/js/jquery/jquery.js",
@@ -69,4 +80,8 @@ JS_CONTENT_TYPES = [
 ]
 
 # HTTP protokolleri (öncelik sırasına göre)
-PROTOCOLS = ["https://", "http://"] 
+PROTOCOLS = ["https://", "http://"]
+
+# Planlama (--plan) ayarları
+PLAN_SAMPLE_SIZE = 20  # Kalibrasyon için örneklenecek domain sayısı (0: kalibrasyon yok)
+PLAN_DEFAULT_LATENCY = 1.0  # Kalibrasyon yapılamazsa varsayılan istek süresi (saniye)
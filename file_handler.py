@@ -5,25 +5,26 @@ Domain listesi okuma ve sonuçları kaydetme işlemlerini yönetir.
 
 import os
 import csv
-from typing import List, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import asyncio
 from utils import logger, normalize_domain
 
 class FileHandler:
-    def __init__(self, domain_file: str, output_file: str):
+    def __init__(self, domain_file: str, output_file: str, create_output: bool = True):
         """
         Dosya işleyici sınıfını başlatır.
         
         Args:
             domain_file: Domain listesini içeren dosya yolu
             output_file: Sonuçların kaydedileceği dosya yolu
+            create_output: Sonuç dosyası yoksa başlık satırıyla oluşturulsun mu
         """
         self.domain_file = domain_file
         self.output_file = output_file
         self._lock = asyncio.Lock()  # Asenkron yazma işlemleri için kilit
         
         # CSV başlığını oluştur
-        if not os.path.exists(self.output_file):
+        if create_output and not os.path.exists(self.output_file):
             self._create_csv_header()
         
     def _create_csv_header(self):
@@ -48,7 +49,7 @@ class FileHandler:
         
         try:
             with open(self.domain_file, 'r', encoding='utf-8') as file:
-                domains = [normalize_domain(line) for line in file if line.strip()]
+                domains = [self._parse_domain_line(line)[0] for line in file if line.strip()]
             
             # Yinelenen domainleri kaldır
             domains = list(dict.fromkeys(domains))
@@ -59,6 +60,95 @@ class FileHandler:
             logger.error(f"Domain dosyası okuma hatası: {str(e)}")
             return []
     
+    def iter_domains(self) -> Iterator[str]:
+        """
+        Domain dosyasını belleğe almadan satır satır okur ve normalize eder.
+        Yinelenen domainler ayıklanmaz, bu işlem çağırana bırakılır.
+        
+        Yields:
+            str: Normalize edilmiş domain adı
+        """
+        if not os.path.exists(self.domain_file):
+            logger.error(f"Domain dosyası bulunamadı: {self.domain_file}")
+            return
+        
+        try:
+            with open(self.domain_file, 'r', encoding='utf-8') as file:
+                for line in file:
+                    if line.strip():
+                        yield self._parse_domain_line(line)[0]
+        except Exception as e:
+            logger.error(f"Domain dosyası okuma hatası: {str(e)}")
+    
+    def _parse_domain_line(self, line: str) -> Tuple[str, Optional[float]]:
+        """
+        Domain dosyasındaki bir satırı domain ve isteğe bağlı öncelik puanına ayırır.
+        Satır "example.com", "example.com,5" veya "example.com 5" biçiminde olabilir.
+        
+        Args:
+            line: Domain dosyasından okunan satır
+            
+        Returns:
+            Tuple[str, Optional[float]]: (normalize edilmiş domain, puan veya None)
+        """
+        fields = line.replace(",", " ").split()
+        domain = normalize_domain(fields[0])
+        
+        score = None
+        if len(fields) > 1:
+            try:
+                score = float(fields[1])
+            except ValueError:
+                logger.debug(f"Geçersiz öncelik puanı: {line.strip()}")
+        
+        return domain, score
+    
+    def read_domain_priorities(self) -> Dict[str, float]:
+        """
+        Domain dosyasındaki isteğe bağlı puan sütununu okur.
+        
+        Returns:
+            Dict[str, float]: Puanı belirtilmiş domainler ve puanları
+        """
+        priorities = {}
+        if not os.path.exists(self.domain_file):
+            return priorities
+        
+        try:
+            with open(self.domain_file, 'r', encoding='utf-8') as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    domain, score = self._parse_domain_line(line)
+                    if score is not None:
+                        priorities[domain] = score
+        except Exception as e:
+            logger.error(f"Öncelik puanları okuma hatası: {str(e)}")
+        
+        return priorities
+    
+    def read_rank_list(self, rank_file: str) -> List[str]:
+        """
+        Öncelik sırası dosyasını okur (her satırda bir domain, en önemli ilk satırda).
+        
+        Args:
+            rank_file: Sıralama dosyasının yolu
+            
+        Returns:
+            List[str]: Öncelik sırasına göre normalize edilmiş domain listesi
+        """
+        if not os.path.exists(rank_file):
+            logger.error(f"Öncelik dosyası bulunamadı: {rank_file}")
+            return []
+        
+        try:
+            with open(rank_file, 'r', encoding='utf-8') as file:
+                ranks = [self._parse_domain_line(line)[0] for line in file if line.strip()]
+            return list(dict.fromkeys(ranks))
+        except Exception as e:
+            logger.error(f"Öncelik dosyası okuma hatası: {str(e)}")
+            return []
+    
     async def save_result(self, domain: str, description: str, js_path: str) -> None:
         """
         Başarılı bir JavaScript bulma sonucunu CSV dosyasına kaydeder.
@@ -149,4 +239,47 @@ class FileHandler:
             except Exception as e:
                 logger.error(f"İşlenmiş domainleri okuma hatası: {str(e)}")
         
-        return processed 
\ No newline at end of file
+        return processed
+    
+    def get_location_hit_counts(self, domains: Set[str]) -> Dict[str, int]:
+        """
+        Önceki sonuçlardan her tarama konumunun (root, folder(xxx), subdomain(xxx))
+        kaç kez JavaScript bulduğunu sayar. _format_url işleminin tersidir.
+        
+        Args:
+            domains: Taranan domainler (root ve subdomain ayrımı için)
+            
+        Returns:
+            Dict[str, int]: Konum açıklaması -> bulunma sayısı
+        """
+        counts: Dict[str, int] = {}
+        
+        if not os.path.exists(self.output_file):
+            return counts
+        
+        try:
+            with open(self.output_file, 'r', encoding='utf-8', newline='') as csvfile:
+                reader = csv.reader(csvfile)
+                next(reader, None)  # Başlık satırını atla
+                
+                for row in reader:
+                    if not row:
+                        continue
+                    url = row[0]
+                    if "/" in url:
+                        domain, folder = url.split("/", 1)
+                        if domain not in domains:
+                            continue
+                        description = f"folder({folder})"
+                    elif url in domains:
+                        description = "root"
+                    elif "." in url and url.split(".", 1)[1] in domains:
+                        description = f"subdomain({url.split('.', 1)[0]})"
+                    else:
+                        continue
+                    counts[description] = counts.get(description, 0) + 1
+                    
+        except Exception as e:
+            logger.error(f"Konum istatistiklerini okuma hatası: {str(e)}")
+        
+        return counts
@@ -4,20 +4,30 @@ JavaScript Tarama Botu Ana Programı
 Bu program, verilen domain listesini ve belirtilen JavaScript dosyalarını asenkron olarak tarar.
 """
 
+import argparse
 import asyncio
 import time
 import sys
-from typing import List, Dict, Any, Set
-from collections import defaultdict
+from typing import List, Dict, Any, Deque, Iterator, Optional, Set, Tuple
+from collections import defaultdict, deque
 
 import config
-from utils import logger, chunk_list
+from utils import logger, chunk_list, build_scan_locations
 from file_handler import FileHandler
 from requester import JSRequester
+from planner import ScanPlanner
+from scheduler import ScanScheduler
 
 class JSScannerBot:
-    def __init__(self):
-        """JavaScript Tarama Botunu başlatır"""
+    def __init__(self, deadline: float = config.DEADLINE_SECONDS,
+                 priority_file: Optional[str] = config.PRIORITY_FILE):
+        """
+        JavaScript Tarama Botunu başlatır.
+        
+        Args:
+            deadline: Taramanın tamamlanması gereken süre (saniye, 0: süre sınırı yok)
+            priority_file: Öncelik sırası dosyası (None ise sadece domain dosyasındaki puanlar kullanılır)
+        """
         self.file_handler = FileHandler(
             domain_file=config.DOMAIN_LIST_FILE,
             output_file=config.OUTPUT_FILE
@@ -30,6 +40,8 @@ class JSScannerBot:
         self.domain_found_count: Dict[str, int] = defaultdict(int)  # Her domain'in kaç kez bulunduğunu takip eder
         self.success_count = 0
         self.start_time = time.time()
+        self.deadline = deadline
+        self.scheduler = ScanScheduler(self.file_handler, priority_file)
     
     async def scan_domain_list_for_js(self, domains: List[str], js_paths: List[str], 
                                      location_info: Dict[str, Any]) -> None:
@@ -112,6 +124,142 @@ class JSScannerBot:
             logger.info(f"İlerleme: {i+1}/{total_chunks} chunk, {self.success_count} başarılı, "
                        f"{domains_per_second:.2f} domain/s")
     
+    async def process_locations_in_order(self, domains: List[str]) -> None:
+        """
+        Kök dizin, klasör ve subdomain taramalarını sırasıyla yapar.
+        
+        Args:
+            domains: Taranacak domain listesi
+        """
+        for location_info in build_scan_locations():
+            if location_info.get("use_folders", False):
+                logger.info(f"Klasör taraması başlatılıyor: {location_info['folder']}")
+            elif location_info.get("use_subdomain", False):
+                logger.info(f"Subdomain taraması başlatılıyor: {location_info['subdomain']}")
+            else:
+                logger.info(f"Kök dizin taraması başlatılıyor ({len(domains)} domain)")
+                
+            await self.process_domains_in_chunks(
+                domains,
+                config.JS_PATHS,
+                location_info
+            )
+    
+    def _next_scheduled_unit(self, work: Iterator[Tuple[float, str, Dict[str, Any]]],
+                             deferred: Dict[str, Deque[Tuple[float, Dict[str, Any]]]],
+                             in_flight: Set[str]) -> Optional[Tuple[float, str, Dict[str, Any]]]:
+        """
+        Taranabilir en değerli iş birimini döndürür. Domaini o anda taranan iş
+        birimleri ertelenir ve domain boşaldığında sıradaki işlerden önce alınır.
+        
+        Args:
+            work: Değere göre azalan sırada iş birimi akışı
+            deferred: Domaini meşgul olduğu için ertelenen iş birimleri
+            in_flight: O anda isteği devam eden domainler
+            
+        Returns:
+            Optional[Tuple[float, str, Dict[str, Any]]]: (değer, domain, konum bilgisi), iş kalmadıysa None
+        """
+        # Ertelenen işler akıştan önce çekildiği için akıştaki her işten daha değerlidir
+        best = None
+        for domain, units in deferred.items():
+            if domain not in in_flight and (best is None or units[0][0] > deferred[best][0][0]):
+                best = domain
+        if best is not None:
+            value, location_info = deferred[best].popleft()
+            if not deferred[best]:
+                del deferred[best]
+            return value, best, location_info
+        
+        for value, domain, location_info in work:
+            if domain in in_flight:
+                deferred.setdefault(domain, deque()).append((value, location_info))
+                continue
+            return value, domain, location_info
+        
+        return None
+    
+    async def _scheduled_worker(self, work: Iterator[Tuple[float, str, Dict[str, Any]]],
+                                deferred: Dict[str, Deque[Tuple[float, Dict[str, Any]]]],
+                                in_flight: Set[str], progress: Dict[str, float],
+                                deadline_at: Optional[float]) -> None:
+        """
+        Sıradaki en değerli iş birimini alıp tarayan işçi. Aynı domain için aynı
+        anda en fazla bir istek gönderilir; 3 kez bulunma limiti ve süre sınırı
+        her istekten hemen önce kontrol edilir.
+        
+        Args:
+            work: Değere göre azalan sırada iş birimi akışı
+            deferred: Domaini meşgul olduğu için ertelenen iş birimleri
+            in_flight: O anda isteği devam eden domainler
+            progress: Tamamlanan/atlanan iş birimi sayaçları ve taranan değer
+            deadline_at: Süre sınırının dolduğu zaman (None ise süre sınırı yok)
+        """
+        while not (deadline_at and time.time() >= deadline_at):
+            unit = self._next_scheduled_unit(work, deferred, in_flight)
+            if unit is None:
+                return
+            
+            value, domain, location_info = unit
+            if self.domain_found_count[domain] >= 3:
+                progress["skipped"] += 1
+                continue
+            
+            in_flight.add(domain)
+            try:
+                await self._scan_and_save_domain(domain, config.JS_PATHS, location_info)
+            finally:
+                in_flight.discard(domain)
+            
+            progress["completed"] += 1
+            progress["completed_value"] += value
+            if progress["completed"] % config.CHUNK_SIZE == 0:
+                logger.info(f"İlerleme: {progress['completed']} iş birimi tamamlandı, "
+                            f"{self.success_count} başarılı")
+    
+    async def process_scheduled(self, domains: List[str]) -> None:
+        """
+        İş birimlerini (domain, konum) öncelik ve beklenen verime göre sıralı olarak
+        tarar. CONCURRENT_REQUESTS kadar işçi sıradaki en değerli iş birimini alır,
+        böylece daha değerli bir iş beklerken daha değersiz bir iş başlamaz. Süre
+        sınırı varsa, sınır dolduğunda devam eden istekler iptal edilir ve ulaşılan
+        kapsam raporlanır.
+        
+        Args:
+            domains: Taranacak domain listesi
+        """
+        deadline_at = self.start_time + self.deadline if self.deadline > 0 else None
+        work = self.scheduler.iter_work(domains)
+        deferred: Dict[str, Deque[Tuple[float, Dict[str, Any]]]] = {}
+        in_flight: Set[str] = set()
+        progress = {"completed": 0, "skipped": 0, "completed_value": 0.0}
+        
+        if deadline_at:
+            logger.info(f"Öncelikli tarama başlatılıyor ({len(domains)} domain, "
+                        f"{self.deadline:g}s süre sınırı)")
+        else:
+            logger.info(f"Öncelikli tarama başlatılıyor ({len(domains)} domain)")
+        
+        workers = [
+            asyncio.create_task(self._scheduled_worker(work, deferred, in_flight, progress, deadline_at))
+            for _ in range(config.CONCURRENT_REQUESTS)
+        ]
+        timeout = deadline_at - time.time() if deadline_at else None
+        done, pending = await asyncio.wait(workers, timeout=timeout)
+        
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            task.result()  # İşçilerdeki beklenmeyen hataları yukarı taşı
+        deadline_reached = bool(deadline_at) and time.time() >= deadline_at
+        
+        logger.info(f"İlerleme: {progress['completed']} iş birimi tamamlandı, "
+                    f"{self.success_count} başarılı")
+        self.scheduler.log_coverage(domains, progress["completed"], progress["skipped"],
+                                    progress["completed_value"], deadline_reached)
+    
     async def run(self) -> None:
         """Ana tarama işlemini başlatır"""
         try:
@@ -126,39 +274,13 @@ class JSScannerBot:
             if self.processed_domains:
                 logger.info(f"{len(self.processed_domains)} domain daha önce işlenmiş, atlanacak")
             
-            # 1. Kök dizin taraması
-            logger.info(f"Kök dizin taraması başlatılıyor ({len(domains)} domain)")
-            await self.process_domains_in_chunks(
-                domains, 
-                config.JS_PATHS, 
-                {"description": "root"}
-            )
-            
-            # 2. Klasör taraması
-            for folder in config.FOLDERS:
-                logger.info(f"Klasör taraması başlatılıyor: {folder}")
-                await self.process_domains_in_chunks(
-                    domains,
-                    config.JS_PATHS,
-                    {
-                        "use_folders": True,
-                        "folder": folder,
-                        "description": f"folder({folder})"
-                    }
-                )
-            
-            # 3. Subdomain taraması
-            for subdomain in config.SUBDOMAINS:
-                logger.info(f"Subdomain taraması başlatılıyor: {subdomain}")
-                await self.process_domains_in_chunks(
-                    domains,
-                    config.JS_PATHS,
-                    {
-                        "use_subdomain": True,
-                        "subdomain": subdomain,
-                        "description": f"subdomain({subdomain})"
-                    }
-                )
+            # Öncelik veya süre sınırı varsa işler değere göre sıralanır
+            priorities = self.scheduler.load_priorities(domains)
+            has_priorities = any(score != config.DEFAULT_PRIORITY for score in priorities.values())
+            if self.deadline > 0 or has_priorities:
+                await self.process_scheduled(domains)
+            else:
+                await self.process_locations_in_order(domains)
             
             # Toplam çalışma süresi
             total_time = time.time() - self.start_time
@@ -170,12 +292,49 @@ class JSScannerBot:
         except Exception as e:
             logger.error(f"Beklenmeyen hata: {str(e)}")
         finally:
+            # Bağlantı havuzu kullanımı (yarıda kalan taramalarda da raporlanır)
+            pool_stats = self.requester.get_connection_stats()
+            logger.info(f"Bağlantı havuzu: {pool_stats['requests']} istek, "
+                       f"{pool_stats['connections_created']} yeni bağlantı "
+                       f"(bağlantı başına {pool_stats['requests_per_connection']:.2f} istek), "
+                       f"{pool_stats['connections_reused']} yeniden kullanım "
+                       f"(oran {pool_stats['reuse_ratio']:.2f}), "
+                       f"{pool_stats['tls_handshakes']} TLS el sıkışması, "
+                       f"{pool_stats['handshakes_avoided']} el sıkışması önlendi")
+            
             # Kaynakları temizle
             await self.requester.close()
 
 async def main():
     """Ana program giriş noktası"""
-    scanner = JSScannerBot()
+    parser = argparse.ArgumentParser(description="JavaScript Tarama Botu")
+    parser.add_argument("--plan", action="store_true",
+                        help="Tarama yapmadan istek sayısını ve süreyi tahmin et "
+                             "(kalibrasyon için ilk PLAN_SAMPLE_SIZE domaine gerçek HEAD "
+                             "istekleri gönderir, PLAN_SAMPLE_SIZE = 0 ile kapatılır)")
+    parser.add_argument("--deadline", type=float, default=config.DEADLINE_SECONDS,
+                        help="Taramanın tamamlanması gereken süre (saniye)")
+    parser.add_argument("--priority-file", default=config.PRIORITY_FILE,
+                        help="Öncelik sırası dosyası (her satırda bir domain)")
+    args = parser.parse_args()
+    
+    if args.plan:
+        # Plan modu sonuç dosyası oluşturmaz
+        file_handler = FileHandler(
+            domain_file=config.DOMAIN_LIST_FILE,
+            output_file=config.OUTPUT_FILE,
+            create_output=False
+        )
+        requester = None
+        if config.PLAN_SAMPLE_SIZE > 0:
+            requester = JSRequester(
+                timeout=config.TIMEOUT,
+                retry_count=config.RETRY_COUNT
+            )
+        await ScanPlanner(file_handler, requester).plan()
+        return
+    
+    scanner = JSScannerBot(deadline=args.deadline, priority_file=args.priority_file)
     await scanner.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,255 @@
+"""
+Tarama planlama modülü.
+Bir tarama başlatılmadan önce gönderilecek istek sayısını ve tahmini süreyi hesaplar.
+"""
+
+import asyncio
+import math
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+import config
+from utils import logger, build_urls, build_scan_locations
+from file_handler import FileHandler
+from requester import JSRequester
+
+class ScanPlanner:
+    def __init__(self, file_handler: FileHandler, requester: Optional[JSRequester] = None):
+        """
+        Tarama planlayıcısını başlatır.
+
+        Args:
+            file_handler: Domain listesini okuyacak dosya işleyici
+            requester: Kalibrasyon istekleri için kullanılacak istek sınıfı (None ise kalibrasyon yapılmaz)
+        """
+        self.file_handler = file_handler
+        self.requester = requester
+
+    def collect_domains(self) -> Dict[str, Any]:
+        """
+        Domain dosyasını satır satır okur ve budama istatistiklerini çıkarır.
+
+        Returns:
+            Dict[str, Any]: Benzersiz domainler ve yinelenen/daha önce işlenmiş domain sayıları
+        """
+        domains = {}
+        total_lines = 0
+        for domain in self.file_handler.iter_domains():
+            total_lines += 1
+            domains[domain] = None
+
+        processed = self.file_handler.get_already_processed_domains()
+        already_processed = sum(1 for domain in domains if domain in processed)
+
+        return {
+            "domains": list(domains),
+            "total_lines": total_lines,
+            "duplicates": total_lines - len(domains),
+            "already_processed": already_processed
+        }
+
+    def _phase_kind(self, location_info: Dict[str, Any]) -> str:
+        """
+        Konum bilgisinin aşama türünü döndürür.
+
+        Args:
+            location_info: Konum bilgisi (kök, klasör, subdomain)
+
+        Returns:
+            str: "root", "folder" veya "subdomain"
+        """
+        if location_info.get("use_folders", False):
+            return "folder"
+        if location_info.get("use_subdomain", False):
+            return "subdomain"
+        return "root"
+
+    async def calibrate(self, domains: List[str], js_paths: List[str]) -> Dict[str, Any]:
+        """
+        Küçük bir domain örneği üzerinde kök dizin, ilk klasör ve ilk subdomain
+        aşamalarını gerçekten çalıştırarak ortalama istek süresini ve her aşama türü
+        için erken çıkış ve bulma oranlarını ölçer.
+
+        Args:
+            domains: Örneklenecek domain listesi
+            js_paths: Kontrol edilecek JavaScript yolları
+
+        Returns:
+            Dict[str, Any]: Ortalama istek süresi ve aşama türü başına
+                gönderilen/maksimum istek oranı ile bulma oranı
+        """
+        sample = domains[:config.PLAN_SAMPLE_SIZE]
+        if self.requester is None or not sample:
+            return {"latency": config.PLAN_DEFAULT_LATENCY, "phases": {}, "sample_size": 0}
+
+        # Her aşama türünden bir konum örneklenir
+        sampled_locations = {}
+        for location_info in build_scan_locations():
+            sampled_locations.setdefault(self._phase_kind(location_info), location_info)
+
+        max_requests = len(sample) * len(config.PROTOCOLS) * len(js_paths)
+        phases = {}
+        sent_total = 0
+        elapsed_total = 0.0
+        try:
+            for kind, location_info in sampled_locations.items():
+                results = await asyncio.gather(*[
+                    self._calibrate_domain(domain, js_paths, location_info) for domain in sample
+                ])
+                sent = sum(result[0] for result in results)
+                sent_total += sent
+                elapsed_total += sum(result[2] for result in results)
+                phases[kind] = {
+                    "request_ratio": sent / max_requests if max_requests else 1.0,
+                    "hit_ratio": sum(1 for result in results if result[1]) / len(sample)
+                }
+        finally:
+            await self.requester.close()
+
+        return {
+            "latency": elapsed_total / sent_total if sent_total else config.PLAN_DEFAULT_LATENCY,
+            "phases": phases,
+            "sample_size": len(sample)
+        }
+
+    async def _calibrate_domain(self, domain: str, js_paths: List[str],
+                                location_info: Dict[str, Any]) -> Tuple[int, bool, float]:
+        """
+        Bir domainin belirtilen konumdaki URL'lerini scan_domain_for_js ile aynı
+        sırada, ilk bulunan URL'de durarak tarar.
+
+        Args:
+            domain: Taranacak domain
+            js_paths: Kontrol edilecek JavaScript yolları
+            location_info: Konum bilgisi (kök, klasör, subdomain)
+
+        Returns:
+            Tuple[int, bool, float]: (gönderilen istek sayısı, bulundu mu, toplam istek süresi)
+        """
+        urls = build_urls(
+            domain,
+            js_paths,
+            use_folders=location_info.get("use_folders", False),
+            folder=location_info.get("folder"),
+            use_subdomain=location_info.get("use_subdomain", False),
+            subdomain=location_info.get("subdomain")
+        )
+
+        sent = 0
+        elapsed = 0.0
+        for url, _ in urls:
+            started = time.time()
+            is_js, _ = await self.requester.check_js_file(url)
+            elapsed += time.time() - started
+            sent += 1
+            if is_js:
+                return sent, True, elapsed
+        return sent, False, elapsed
+
+    def estimate_phase(self, domain_count: int, js_paths: List[str], latency: float,
+                       request_ratio: float, active_ratio: float) -> Dict[str, float]:
+        """
+        Tek bir tarama aşaması (konum) için istek sayısını ve süreyi tahmin eder.
+
+        Her chunk içindeki domainler eşzamanlı, bir domainin URL'leri ise sırayla
+        taranır; bu yüzden süre chunk başına dalga sayısı ile domain başına istek
+        sayısının çarpımıyla hesaplanır.
+
+        Args:
+            domain_count: Taranacak domain sayısı
+            js_paths: Kontrol edilecek JavaScript yolları
+            latency: Ortalama istek süresi (saniye)
+            request_ratio: Erken çıkışlar sonrası gönderilen/maksimum istek oranı
+            active_ratio: 3 kez bulunma limitine takılmamış domain oranı
+
+        Returns:
+            Dict[str, float]: Maksimum istek, beklenen istek ve tahmini süre
+        """
+        per_domain = len(config.PROTOCOLS) * len(js_paths)
+        max_requests = domain_count * per_domain
+
+        seconds = 0.0
+        remaining = domain_count
+        while remaining > 0:
+            chunk = min(remaining, config.CHUNK_SIZE)
+            waves = math.ceil(chunk * active_ratio / config.CONCURRENT_REQUESTS)
+            seconds += waves * per_domain * request_ratio * latency
+            remaining -= chunk
+
+        return {
+            "max_requests": max_requests,
+            "expected_requests": max_requests * active_ratio * request_ratio,
+            "seconds": seconds
+        }
+
+    async def plan(self) -> Dict[str, Any]:
+        """
+        Tarama planını oluşturur ve loglar.
+
+        Returns:
+            Dict[str, Any]: Aşama bazında istek sayıları ve toplam süre tahmini
+        """
+        collected = self.collect_domains()
+        domains = collected["domains"]
+        logger.info(f"Plan: {collected['total_lines']} satır, {len(domains)} benzersiz domain, "
+                    f"{collected['duplicates']} yinelenen domain ayıklandı")
+        if collected["already_processed"]:
+            logger.info(f"Plan: {collected['already_processed']} domain önceki sonuç dosyasında mevcut "
+                        f"(tarama bu domainleri atlamadığı için istek sayısına dahil edildi)")
+
+        if not domains:
+            logger.error("Planlanacak domain bulunamadı.")
+            return {"phases": [], "max_requests": 0, "expected_requests": 0, "seconds": 0.0}
+
+        calibration = await self.calibrate(domains, config.JS_PATHS)
+        if calibration["sample_size"]:
+            for kind, measured in calibration["phases"].items():
+                logger.info(f"Kalibrasyon ({kind}): {calibration['sample_size']} domain, "
+                            f"istek oranı {measured['request_ratio']:.2f}, "
+                            f"bulma oranı {measured['hit_ratio']:.2f}")
+            logger.info(f"Kalibrasyon: ortalama istek süresi {calibration['latency']:.3f}s")
+        else:
+            logger.info(f"Kalibrasyon yapılmadı, varsayılan istek süresi "
+                        f"{calibration['latency']:.3f}s kullanılıyor")
+
+        # Her aşamaya kendi türünde ölçülen oranlar uygulanır (klasörler için ilk klasör,
+        # subdomainler için ilk subdomain). Ölçüm yoksa erken çıkış ve 3 kez bulunma
+        # limiti hesaba katılmaz
+        unmeasured = {"request_ratio": 1.0, "hit_ratio": 0.0}
+
+        # 3 kez bulunma limitine takılmamış domainlerin 0, 1 ve 2 bulunmaya göre dağılımı
+        hit_distribution = [1.0, 0.0, 0.0]
+        phases = []
+        for location_info in build_scan_locations():
+            measured = calibration["phases"].get(self._phase_kind(location_info), unmeasured)
+            estimate = self.estimate_phase(
+                len(domains),
+                config.JS_PATHS,
+                calibration["latency"],
+                measured["request_ratio"],
+                sum(hit_distribution)
+            )
+            estimate["description"] = location_info["description"]
+            phases.append(estimate)
+            logger.info(f"Plan ({estimate['description']}): en fazla {estimate['max_requests']} istek, "
+                        f"beklenen {estimate['expected_requests']:.0f} istek, "
+                        f"~{estimate['seconds']:.1f}s")
+
+            hit = measured["hit_ratio"]
+            hit_distribution = [
+                hit_distribution[0] * (1 - hit),
+                hit_distribution[1] * (1 - hit) + hit_distribution[0] * hit,
+                hit_distribution[2] * (1 - hit) + hit_distribution[1] * hit
+            ]
+
+        result = {
+            "phases": phases,
+            "max_requests": sum(phase["max_requests"] for phase in phases),
+            "expected_requests": sum(phase["expected_requests"] for phase in phases),
+            "seconds": sum(phase["seconds"] for phase in phases)
+        }
+        logger.info(f"Plan toplamı: en fazla {result['max_requests']} istek, "
+                    f"beklenen {result['expected_requests']:.0f} istek, "
+                    f"tahmini süre {result['seconds'] / 60:.1f} dakika "
+                    f"({config.CONCURRENT_REQUESTS} eşzamanlı istek)")
+        return result
@@ -27,17 +27,77 @@ class JSRequester:
         self.timeout = timeout
         self.retry_count = retry_count
         self.session = None
+        self.connection_stats = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "tls_handshakes": 0,
+            "handshakes_avoided": 0
+        }
     
     async def initialize(self):
         """Oturum başlatma işlemi"""
         if self.session is None or self.session.closed:
             # SSL doğrulama devre dışı bırakılabilir (gerekirse)
-            conn = aiohttp.TCPConnector(
-                limit=config.CONCURRENT_REQUESTS,
-                ttl_dns_cache=300,
-                ssl=False
+            connector_options = {
+                "limit": config.CONCURRENT_REQUESTS,
+                "limit_per_host": config.CONNECTION_LIMIT_PER_HOST,
+                "ttl_dns_cache": config.DNS_CACHE_TTL,
+                "force_close": config.FORCE_CLOSE,
+                "ssl": False
+            }
+            # aiohttp, force_close ile birlikte keepalive_timeout verilmesine izin vermez
+            if not config.FORCE_CLOSE:
+                connector_options["keepalive_timeout"] = config.KEEPALIVE_TIMEOUT
+            
+            conn = aiohttp.TCPConnector(**connector_options)
+            self.session = aiohttp.ClientSession(
+                connector=conn,
+                trace_configs=[self._create_trace_config()]
             )
-            self.session = aiohttp.ClientSession(connector=conn)
+    
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Bağlantı havuzu kullanımını sayan trace yapılandırmasını oluşturur.
+        
+        Returns:
+            aiohttp.TraceConfig: İstek ve bağlantı olaylarını dinleyen yapılandırma
+        """
+        stats = self.connection_stats
+        
+        async def on_request_start(session, trace_config_ctx, params):
+            trace_config_ctx.is_https = params.url.scheme == "https"
+            stats["requests"] += 1
+        
+        async def on_connection_create_end(session, trace_config_ctx, params):
+            stats["connections_created"] += 1
+            if getattr(trace_config_ctx, "is_https", False):
+                stats["tls_handshakes"] += 1
+        
+        async def on_connection_reuseconn(session, trace_config_ctx, params):
+            stats["connections_reused"] += 1
+            if getattr(trace_config_ctx, "is_https", False):
+                stats["handshakes_avoided"] += 1
+        
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+    
+    def get_connection_stats(self) -> Dict[str, float]:
+        """
+        Bağlantı havuzu istatistiklerini döndürür.
+        
+        Returns:
+            Dict[str, float]: Sayaçlar ve yeniden kullanım oranı
+        """
+        stats = dict(self.connection_stats)
+        acquired = stats["connections_created"] + stats["connections_reused"]
+        stats["reuse_ratio"] = stats["connections_reused"] / acquired if acquired else 0.0
+        created = stats["connections_created"]
+        stats["requests_per_connection"] = stats["requests"] / created if created else 0.0
+        return stats
     
     async def close(self):
         """Oturumu kapatma işlemi"""
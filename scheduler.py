@@ -0,0 +1,144 @@
+"""
+Öncelikli tarama zamanlayıcısı modülü.
+Domain önceliklerine ve konumların beklenen verimine göre tarama sırasını belirler.
+"""
+
+import heapq
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+import config
+from utils import logger, build_scan_locations
+from file_handler import FileHandler
+
+class ScanScheduler:
+    def __init__(self, file_handler: FileHandler, priority_file: Optional[str] = config.PRIORITY_FILE):
+        """
+        Tarama zamanlayıcısını başlatır.
+
+        Args:
+            file_handler: Domain, puan ve önceki sonuç dosyalarını okuyacak dosya işleyici
+            priority_file: Öncelik sırası dosyası (None ise sadece domain dosyasındaki puanlar kullanılır)
+        """
+        self.file_handler = file_handler
+        self.priority_file = priority_file
+        self.priorities: Dict[str, float] = {}
+        self.location_yields: Dict[str, float] = {}
+
+    def load_priorities(self, domains: List[str]) -> Dict[str, float]:
+        """
+        Domain önceliklerini domain dosyasındaki puan sütunundan ve öncelik sırası
+        dosyasından yükler. Sıralama dosyasındaki domainler puan sütununun önüne geçer.
+
+        Args:
+            domains: Taranacak domain listesi
+
+        Returns:
+            Dict[str, float]: Domain -> öncelik puanı
+        """
+        priorities = {domain: config.DEFAULT_PRIORITY for domain in domains}
+        priorities.update({
+            domain: score
+            for domain, score in self.file_handler.read_domain_priorities().items()
+            if domain in priorities
+        })
+
+        if self.priority_file:
+            ranks = self.file_handler.read_rank_list(self.priority_file)
+            top_score = max(priorities.values(), default=config.DEFAULT_PRIORITY)
+            for index, domain in enumerate(ranks):
+                if domain in priorities:
+                    priorities[domain] = top_score + len(ranks) - index
+
+        self.priorities = priorities
+        return priorities
+
+    def load_location_yields(self, domains: List[str],
+                             locations: List[Dict[str, Any]]) -> Dict[str, float]:
+        """
+        Her konumun beklenen verimini önceki sonuçlardaki bulunma sayılarından tahmin eder.
+        Geçmiş yoksa tüm konumlar eşit kabul edilir ve varsayılan tarama sırası korunur.
+
+        Args:
+            domains: Taranacak domain listesi
+            locations: Tarama konumları
+
+        Returns:
+            Dict[str, float]: Konum açıklaması -> göreli verim
+        """
+        hits = self.file_handler.get_location_hit_counts(set(domains))
+        descriptions = [location["description"] for location in locations]
+        # Artık taranmayan konumların geçmiş bulunmaları paydaya katılmaz
+        total = sum(hits.get(description, 0) for description in descriptions) + len(locations)
+
+        # Laplace yumuşatma: hiç bulunmamış konumlar da sıfırdan büyük verim alır
+        self.location_yields = {
+            description: (hits.get(description, 0) + 1) / total
+            for description in descriptions
+        }
+        return self.location_yields
+
+    def iter_work(self, domains: List[str]) -> Iterator[Tuple[float, str, Dict[str, Any]]]:
+        """
+        (değer, domain, konum) iş birimlerini değere göre azalan sırada üretir.
+        Değer, domain önceliği ile konum veriminin çarpımıdır. Eşit değerlerde
+        varsayılan tarama sırası (konum sırası, ardından dosya sırası) korunur.
+
+        Args:
+            domains: Taranacak domain listesi
+
+        Yields:
+            Tuple[float, str, Dict[str, Any]]: (değer, domain, konum bilgisi)
+        """
+        locations = build_scan_locations()
+        if not self.priorities:
+            self.load_priorities(domains)
+        if not self.location_yields:
+            self.load_location_yields(domains, locations)
+
+        # Domainler bir kez sıralanır, her konum için bu sıra tekrar kullanılır
+        ranked = sorted(range(len(domains)), key=lambda i: -self.priorities[domains[i]])
+
+        def location_stream(location_index: int):
+            location_yield = self.location_yields[locations[location_index]["description"]]
+            for domain_index in ranked:
+                value = self.priorities[domains[domain_index]] * location_yield
+                yield -value, location_index, domain_index
+
+        merged = heapq.merge(*[location_stream(i) for i in range(len(locations))])
+        for negative_value, location_index, domain_index in merged:
+            yield -negative_value, domains[domain_index], locations[location_index]
+
+    def total_value(self, domains: List[str]) -> float:
+        """
+        Tüm iş birimlerinin toplam değerini döndürür.
+
+        Args:
+            domains: Taranacak domain listesi
+
+        Returns:
+            float: Toplam değer
+        """
+        return (sum(self.priorities.get(domain, config.DEFAULT_PRIORITY) for domain in domains)
+                * sum(self.location_yields.values()))
+
+    def log_coverage(self, domains: List[str], completed: int, skipped: int,
+                     completed_value: float, deadline_reached: bool) -> None:
+        """
+        Süre sınırı içinde ulaşılan kapsamı loglar.
+
+        Args:
+            domains: Taranan domain listesi
+            completed: Tamamlanan iş birimi sayısı
+            skipped: 3 kez bulunma limiti nedeniyle atlanan iş birimi sayısı
+            completed_value: Sadece gerçekten taranan iş birimlerinin toplam değeri
+            deadline_reached: Süre sınırına ulaşılıp ulaşılmadığı
+        """
+        total_units = len(domains) * len(self.location_yields)
+        total_value = self.total_value(domains)
+        unit_ratio = completed / total_units if total_units else 0.0
+        value_ratio = completed_value / total_value if total_value else 0.0
+
+        status = "süre sınırına ulaşıldı" if deadline_reached else "tüm iş birimleri tamamlandı"
+        logger.info(f"Kapsam ({status}): {completed}/{total_units} iş birimi tarandı "
+                    f"(%{unit_ratio * 100:.1f}), değer kapsamı %{value_ratio * 100:.1f}; "
+                    f"{skipped} iş birimi 3 kez bulunma limiti nedeniyle atlandı")
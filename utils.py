@@ -4,7 +4,7 @@ URL manipülasyonu ve içerik doğrulama fonksiyonlarını içerir.
 """
 
 import logging
-from typing import List, Tuple
+from typing import Any, Dict, List, Tuple
 import config
 
 # Loglama yapılandırması
@@ -105,4 +105,29 @@ def chunk_list(input_list: List, chunk_size: int) -> List[List]:
     Returns:
         List[List]: Parçalanmış liste
     """
-    return [input_list[i:i + chunk_size] for i in range(0, len(input_list), chunk_size)] 
\ No newline at end of file
+    return [input_list[i:i + chunk_size] for i in range(0, len(input_list), chunk_size)]
+
+def build_scan_locations() -> List[Dict[str, Any]]:
+    """
+    Tarama sırasına göre konum bilgisi listesini oluşturur (kök, klasörler, subdomainler).
+    
+    Returns:
+        List[Dict[str, Any]]: Tarama aşamalarına ait konum bilgileri
+    """
+    locations = [{"description": "root"}]
+    
+    for folder in config.FOLDERS:
+        locations.append({
+            "use_folders": True,
+            "folder": folder,
+            "description": f"folder({folder})"
+        })
+    
+    for subdomain in config.SUBDOMAINS:
+        locations.append({
+            "use_subdomain": True,
+            "subdomain": subdomain,
+            "description": f"subdomain({subdomain})"
+        })
+    
+    return locations